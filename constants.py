@@ -5,6 +5,7 @@ from enum import Enum
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 545
 FPS = 60
+IDLE_WAIT_MS = 1000 // FPS
 
 COLOR_WHITE = (255, 255, 255)
 COLOR_BLACK = (0, 0, 0)
@@ -24,11 +25,22 @@ CHARACTER_SIZE = 120
 BOAT_WIDTH = 230
 BOAT_HEIGHT = 180
 
+SIDES = ('left', 'right')
+CHARACTER_TYPES = ('missionary', 'cannibal')
+BANK_X = (LEFT_BANK_X, RIGHT_BANK_X)
+Y_BY_TYPE = (CHARACTER_Y_TOP, CHARACTER_Y_BOTTOM)
+PASSENGER_OFFSETS = {0: (), 1: (0,), 2: (-30, 30)}
+
 BOAT_SPEED = 3
 WOBBLE_SPEED = 0.15
 WOBBLE_AMOUNT = 8
 EATING_DURATION = 2.0
 
+MAX_DIRTY_RECTS = 40
+MAX_DIRTY_AREA_RATIO = 0.5
+ROTATION_STEP = 2
+MIN_ROTATION_ANGLE = 0.5
+
 MISSIONARY_IMAGE = "assets/missionary.png"
 CANNIBAL_IMAGE = "assets/cannibal.png"
 BACKGROUND_IMAGE = "assets/background.png"
@@ -4,12 +4,13 @@ import pygame
 import sys
 import os
 from constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, CHARACTER_SIZE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_WAIT_MS, CHARACTER_SIZE,
     BOAT_WIDTH, BOAT_HEIGHT, EATING_DURATION,
     MISSIONARY_IMAGE, CANNIBAL_IMAGE, BACKGROUND_IMAGE, BOAT_IMAGE,
     BoatPosition, GameScreen
 )
-from model import GameState, Character, Boat, build_state_graph
+from model import GameState, Character, Boat
+from solver import solve_puzzle
 from view import GameView
 
 
@@ -19,6 +20,12 @@ class GameController:
     def __init__(self):
         """Initialize pygame, load resources and set up the game."""
         pygame.init()
+
+        self._event_types = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                             pygame.WINDOWEXPOSED)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self._event_types))
+
         pygame.display.set_caption("Missionaries and Cannibals")
 
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -30,7 +37,7 @@ class GameController:
             'small': pygame.font.Font(None, 24)
         }
 
-        self.state_graph = build_state_graph()
+        self._optimal_solution = None
         self.images = self.load_images()
 
         self.view = GameView(self.screen, fonts, self.images)
@@ -38,6 +45,14 @@ class GameController:
         self.reset_game()
         self.current_screen = GameScreen.WELCOME
         self.eating_timer = 0.0
+        self._dirty = True
+
+    @property
+    def optimal_solution(self):
+        """Return the shortest solution from the start state, solving on first access."""
+        if self._optimal_solution is None:
+            self._optimal_solution = solve_puzzle()
+        return self._optimal_solution
 
     def load_images(self):
         """Load all image assets from disk."""
@@ -69,15 +84,18 @@ class GameController:
 
         missionary_img = pygame.image.load(missionary_path).convert_alpha()
         missionary_img = pygame.transform.scale(missionary_img, (CHARACTER_SIZE, CHARACTER_SIZE))
+        missionary_img = missionary_img.premul_alpha()
 
         cannibal_img = pygame.image.load(cannibal_path).convert_alpha()
         cannibal_img = pygame.transform.scale(cannibal_img, (CHARACTER_SIZE, CHARACTER_SIZE))
+        cannibal_img = cannibal_img.premul_alpha()
 
         background_img = pygame.image.load(background_path).convert()
         background_img = pygame.transform.scale(background_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
         boat_img = pygame.image.load(boat_path).convert_alpha()
         boat_img = pygame.transform.scale(boat_img, (BOAT_WIDTH, BOAT_HEIGHT))
+        boat_img = boat_img.premul_alpha()
 
         return {
             'missionary': missionary_img,
@@ -109,11 +127,18 @@ class GameController:
 
         self.boat = Boat(self.images['boat'])
         self.selected_characters = []
+        self.update_side_buckets()
 
     def get_all_characters(self):
         """Return list of all character objects."""
         return self.missionaries + self.cannibals
 
+    def update_side_buckets(self):
+        """Group characters by bank side for click hit-testing."""
+        self.characters_by_side = {'left': [], 'right': []}
+        for char in self.get_all_characters():
+            self.characters_by_side[char.side].append(char)
+
     def handle_character_click(self, char):
         """Handle clicking on a character to board or leave boat."""
         if self.boat.is_moving:
@@ -159,6 +184,7 @@ class GameController:
 
         for char in self.boat.passengers:
             char.side = new_side
+        self.update_side_buckets()
 
     def start_eating_animation(self):
         """Start the eating animation for missionaries on the losing side."""
@@ -197,10 +223,12 @@ class GameController:
 
     def update(self, dt):
         """Update game state each frame."""
+        time_val = pygame.time.get_ticks() * 0.002
+
         if self.current_screen == GameScreen.EATING:
             self.eating_timer += dt
             for char in self.get_all_characters():
-                char.update(dt)
+                char.update(dt, time_val)
 
             if self.eating_timer >= EATING_DURATION + 0.5:
                 self.current_screen = GameScreen.LOST
@@ -216,13 +244,26 @@ class GameController:
             self.finish_crossing()
 
         for char in self.get_all_characters():
-            char.update(dt)
+            char.update(dt, time_val)
+
+    def _has_animations(self):
+        """Check whether the current screen changes from frame to frame.
+
+        The playing screen always animates: the boat bobs and idle
+        characters wobble even when nothing is moving across the river.
+        """
+        return self.current_screen in (GameScreen.WELCOME, GameScreen.PLAYING,
+                                       GameScreen.EATING)
 
     def handle_event(self, event):
         """Handle pygame events."""
         if event.type == pygame.QUIT:
             return False
 
+        if event.type == pygame.WINDOWEXPOSED:
+            self.view.invalidate()
+            return True
+
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_ESCAPE, pygame.K_q):
                 return False
@@ -248,7 +289,8 @@ class GameController:
                     self.try_cross_river()
                     return True
 
-                for char in self.get_all_characters():
+                boat_side = 'left' if self.state.boat == BoatPosition.LEFT else 'right'
+                for char in self.characters_by_side[boat_side]:
                     if char.contains_point(pos):
                         self.handle_character_click(char)
                         break
@@ -262,12 +304,28 @@ class GameController:
         while running:
             dt = self.clock.tick(FPS) / 1000.0
 
-            for event in pygame.event.get():
+            pygame.event.pump()
+            events = pygame.event.get(self._event_types, pump=False)
+
+            for event in events:
+                self._dirty = True
                 if not self.handle_event(event):
                     running = False
 
+            screen = self.current_screen
             self.update(dt)
-            self.view.draw(self)
+            if self._has_animations() or self.current_screen != screen:
+                self._dirty = True
+
+            if self._dirty:
+                self.view.draw(self)
+                self._dirty = False
+            else:
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                if event.type != pygame.NOEVENT:
+                    self._dirty = True
+                    if not self.handle_event(event):
+                        running = False
 
         pygame.quit()
         sys.exit()
@@ -1,23 +1,38 @@
 """Model classes for the Missionaries and Cannibals game."""
 
+import array
 import math
-import pygame
+from typing import NamedTuple
 from constants import (
-    BoatPosition, LEFT_BANK_X, RIGHT_BANK_X, BOAT_LEFT_X, BOAT_RIGHT_X,
-    BOAT_Y, CHARACTER_Y_TOP, CHARACTER_Y_BOTTOM, CHARACTER_SIZE,
+    BoatPosition, BOAT_LEFT_X, BOAT_RIGHT_X, BOAT_Y, CHARACTER_SIZE,
     BOAT_WIDTH, BOAT_HEIGHT, BOAT_SPEED, WOBBLE_SPEED, WOBBLE_AMOUNT,
-    EATING_DURATION
+    EATING_DURATION, SIDES, CHARACTER_TYPES, BANK_X, Y_BY_TYPE,
+    PASSENGER_OFFSETS
 )
+from solver import is_valid_key
 
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = array.array('f', [math.sin(2 * math.pi * i / _SIN_LUT_SIZE)
+                             for i in range(_SIN_LUT_SIZE)])
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
 
-class GameState:
-    """Represents the current state of the puzzle."""
 
-    def __init__(self, missionaries_left, cannibals_left, boat):
-        """Initialize game state with counts and boat position."""
-        self.missionaries_left = missionaries_left
-        self.cannibals_left = cannibals_left
-        self.boat = boat
+def fast_sin(x):
+    """Approximate math.sin(x) with a table lookup, accurate to about 0.006."""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+
+class GameState(NamedTuple):
+    """Represents the current state of the puzzle as an immutable value."""
+
+    missionaries_left: int
+    cannibals_left: int
+    boat: BoatPosition
+
+    @property
+    def key(self):
+        """Return the state packed into a single int in range(32)."""
+        return (self.missionaries_left << 3) | (self.cannibals_left << 1) | self.boat.value
 
     def missionaries_right(self):
         """Return number of missionaries on right bank."""
@@ -33,15 +48,7 @@ class GameState:
             return False
         if not (0 <= self.cannibals_left <= 3):
             return False
-        m_left = self.missionaries_left
-        c_left = self.cannibals_left
-        if m_left > 0 and c_left > m_left:
-            return False
-        m_right = self.missionaries_right()
-        c_right = self.cannibals_right()
-        if m_right > 0 and c_right > m_right:
-            return False
-        return True
+        return is_valid_key(self.key)
 
     def is_goal(self):
         """Check if current state is the winning goal state."""
@@ -50,52 +57,21 @@ class GameState:
                 self.boat == BoatPosition.RIGHT)
 
 
-def build_state_graph():
-    """Build complete state graph for the puzzle."""
-    graph = {}
-    possible_moves = [(1, 0), (2, 0), (0, 1), (0, 2), (1, 1)]
-
-    for m_left in range(4):
-        for c_left in range(4):
-            for boat in BoatPosition:
-                state = GameState(m_left, c_left, boat)
-                if not state.is_valid():
-                    continue
-
-                transitions = []
-                for m_move, c_move in possible_moves:
-                    if boat == BoatPosition.LEFT:
-                        new_m = m_left - m_move
-                        new_c = c_left - c_move
-                        new_boat = BoatPosition.RIGHT
-                        if m_move > m_left or c_move > c_left:
-                            continue
-                    else:
-                        new_m = m_left + m_move
-                        new_c = c_left + c_move
-                        new_boat = BoatPosition.LEFT
-                        m_right = 3 - m_left
-                        c_right = 3 - c_left
-                        if m_move > m_right or c_move > c_right:
-                            continue
-
-                    new_state = GameState(new_m, new_c, new_boat)
-                    if new_state.is_valid():
-                        transitions.append(((m_move, c_move), new_state))
-
-                graph[state] = transitions
-
-    return graph
-
-
 class Character:
     """Represents a missionary or cannibal with sprite."""
 
+    __slots__ = (
+        'char_type', 'type_idx', 'index', 'side_idx', 'selected', 'in_boat',
+        'image', 'wobble_offset', 'visible', 'being_eaten', 'eat_timer', 'eat_scale',
+        'x', 'y', 'target_x', 'target_y', 'angle', 'is_moving'
+    )
+
     def __init__(self, char_type, index, side, image):
         """Initialize character with type, index, side and image."""
         self.char_type = char_type
+        self.type_idx = CHARACTER_TYPES.index(char_type)
         self.index = index
-        self.side = side
+        self.side_idx = SIDES.index(side)
         self.selected = False
         self.in_boat = False
         self.image = image
@@ -112,22 +88,25 @@ class Character:
         self.angle = 0.0
         self.is_moving = False
 
+    @property
+    def side(self):
+        """Return the bank side ('left' or 'right') the character belongs to."""
+        return SIDES[self.side_idx]
+
+    @side.setter
+    def side(self, value):
+        """Set the bank side from 'left' or 'right'."""
+        self.side_idx = SIDES.index(value)
+
     def update_position(self):
         """Update target position based on current state."""
         if self.in_boat:
             return
 
-        base_x = LEFT_BANK_X if self.side == 'left' else RIGHT_BANK_X
-
-        if self.char_type == 'missionary':
-            self.target_y = CHARACTER_Y_TOP
-        else:
-            self.target_y = CHARACTER_Y_BOTTOM
-
-        offset = (self.index - 1) * 70
-        self.target_x = base_x + offset
+        self.target_x = BANK_X[self.side_idx] + (self.index - 1) * 70
+        self.target_y = Y_BY_TYPE[self.type_idx]
 
-    def update(self, dt):
+    def update(self, dt, time_val):
         """Update character animation and position."""
         if self.being_eaten:
             self.eat_timer += dt
@@ -139,21 +118,20 @@ class Character:
 
         dx = self.target_x - self.x
         dy = self.target_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        dist_sq = dx * dx + dy * dy
 
-        if distance > 2:
+        if dist_sq > 4:
             self.is_moving = True
-            speed = 5.0
-            self.x += (dx / distance) * speed
-            self.y += (dy / distance) * speed
+            step = 5.0 / math.sqrt(dist_sq)
+            self.x += dx * step
+            self.y += dy * step
             self.wobble_offset += WOBBLE_SPEED
-            self.angle = math.sin(self.wobble_offset * 10) * WOBBLE_AMOUNT
+            self.angle = fast_sin(self.wobble_offset * 10) * WOBBLE_AMOUNT
         else:
             self.is_moving = False
             self.x = self.target_x
             self.y = self.target_y
-            time_val = pygame.time.get_ticks() * 0.002
-            self.angle = math.sin(self.wobble_offset + time_val) * 2
+            self.angle = fast_sin(self.wobble_offset + time_val) * 2
             self.wobble_offset += 0.01
 
     def contains_point(self, pos):
@@ -166,6 +144,11 @@ class Character:
 class Boat:
     """Represents the boat that carries characters across the river."""
 
+    __slots__ = (
+        'x', 'y', 'target_x', 'is_moving', 'passengers', 'wave_offset',
+        'image', 'angle'
+    )
+
     def __init__(self, image):
         """Initialize boat with image sprite."""
         self.x = float(BOAT_LEFT_X)
@@ -194,14 +177,11 @@ class Boat:
             self.is_moving = False
 
         self.wave_offset += 0.05
-        self.y = BOAT_Y + math.sin(self.wave_offset) * 3
-        self.angle = math.sin(self.wave_offset * 0.8) * 3
-
-        for i, passenger in enumerate(self.passengers):
-            if len(self.passengers) == 1:
-                offset = 0
-            else:
-                offset = -30 if i == 0 else 30
+        self.y = BOAT_Y + fast_sin(self.wave_offset) * 3
+        self.angle = fast_sin(self.wave_offset * 0.8) * 3
+
+        offsets = PASSENGER_OFFSETS[len(self.passengers)]
+        for passenger, offset in zip(self.passengers, offsets):
             passenger.target_x = self.x + offset
             passenger.target_y = self.y - 45
 
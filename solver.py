@@ -0,0 +1,94 @@
+"""Breadth-first solver for the Missionaries and Cannibals puzzle.
+
+States are packed into a single int as
+(missionaries_left << 3) | (cannibals_left << 1) | boat, matching
+GameState.key, so the whole state space fits in range(32).
+"""
+
+MOVES = ((1, 0), (2, 0), (0, 1), (0, 2), (1, 1))
+START_KEY = (3 << 3) | (3 << 1)
+GOAL_KEY = 1
+NUM_KEYS = 32
+
+
+def counts_are_valid(m_left, c_left):
+    """Check whether missionaries are safe on both banks for the given counts."""
+    if m_left > 0 and c_left > m_left:
+        return False
+    m_right = 3 - m_left
+    c_right = 3 - c_left
+    if m_right > 0 and c_right > m_right:
+        return False
+    return True
+
+
+def _build_valid_mask():
+    """Return a bitmask with bit k set for every valid state key k."""
+    mask = 0
+    for key in range(NUM_KEYS):
+        if counts_are_valid(key >> 3, (key >> 1) & 3):
+            mask |= 1 << key
+    return mask
+
+
+VALID_MASK = _build_valid_mask()
+
+
+def is_valid_key(key):
+    """Check if an int-encoded state is valid (no one gets eaten)."""
+    return (VALID_MASK >> key) & 1 == 1
+
+
+def next_key(key, move):
+    """Return the state reached by applying a move, or -1 if it is not allowed."""
+    m_left = key >> 3
+    c_left = (key >> 1) & 3
+    boat = key & 1
+    m_move, c_move = move
+
+    if boat == 0:
+        m_left -= m_move
+        c_left -= c_move
+    else:
+        m_left += m_move
+        c_left += c_move
+
+    if not (0 <= m_left <= 3 and 0 <= c_left <= 3):
+        return -1
+
+    new_key = (m_left << 3) | (c_left << 1) | (boat ^ 1)
+    return new_key if is_valid_key(new_key) else -1
+
+
+def solve_puzzle(start_key=START_KEY):
+    """Return the shortest list of (missionaries, cannibals) boat moves to the goal.
+
+    An empty list is returned when the start is already the goal or the
+    goal cannot be reached.
+    """
+    visited = 1 << start_key
+    parents = [-1] * NUM_KEYS
+    parent_moves = [-1] * NUM_KEYS
+
+    frontier = [start_key]
+    for key in frontier:
+        if key == GOAL_KEY:
+            break
+        for move_index, move in enumerate(MOVES):
+            new_key = next_key(key, move)
+            if new_key >= 0 and not (visited >> new_key) & 1:
+                visited |= 1 << new_key
+                parents[new_key] = key
+                parent_moves[new_key] = move_index
+                frontier.append(new_key)
+
+    if not (visited >> GOAL_KEY) & 1:
+        return []
+
+    moves = []
+    key = GOAL_KEY
+    while key != start_key:
+        moves.append(MOVES[parent_moves[key]])
+        key = parents[key]
+    moves.reverse()
+    return moves
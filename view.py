@@ -1,11 +1,47 @@
 """View class for rendering the Missionaries and Cannibals game."""
 
-import math
+import functools
 import pygame
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, COLOR_BLACK, COLOR_RED,
-    COLOR_GREEN, COLOR_SELECTED, CHARACTER_SIZE, GameScreen
+    COLOR_GREEN, COLOR_SELECTED, COLOR_TEXT_BG, CHARACTER_SIZE, MAX_DIRTY_RECTS,
+    MAX_DIRTY_AREA_RATIO, ROTATION_STEP, MIN_ROTATION_ANGLE,
+    GameScreen
 )
+from model import fast_sin
+
+SURF_REGISTRY = {}
+FONTS = {}
+
+
+@functools.lru_cache(maxsize=512)
+def _get_rotated(image_id, angle_q):
+    """Return a registered image rotated by a quantized angle."""
+    return pygame.transform.rotate(SURF_REGISTRY[image_id], angle_q * ROTATION_STEP)
+
+
+@functools.lru_cache(maxsize=128)
+def _render(font_id, text, color):
+    """Return antialiased text rendered with a registered font."""
+    return FONTS[font_id].render(text, True, color)
+
+
+def _merge_rects(rects):
+    """Return the rects with every overlapping group replaced by its union."""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def _quantize_angle(angle):
+    """Quantize an angle in degrees to the nearest ROTATION_STEP bucket."""
+    return round(angle / ROTATION_STEP) % (360 // ROTATION_STEP)
 
 
 class GameView:
@@ -22,88 +58,111 @@ class GameView:
         self.background_img = images['background']
         self.boat_img = images['boat']
 
+        for font in fonts.values():
+            FONTS[id(font)] = font
+        for image in images.values():
+            SURF_REGISTRY[id(image)] = image
+
+        self._chomp_surf = self.font_large.render("CHOMP CHOMP!", True, COLOR_RED)
+        self._chomp_size = self._chomp_surf.get_size()
+
+        self._welcome_static = self.build_welcome_static()
+        self._start_surf = self.font_medium.render("Press SPACE to Start", True, COLOR_GREEN)
+
+        self._bg_tile = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA)
+        self._bg_tile.fill(COLOR_TEXT_BG)
+
+        self._dirty_rects = []
+        self._prev_dirty = [self.screen.get_rect()]
+
     def draw_character(self, char):
-        """Draw a character sprite with rotation and selection highlight."""
+        """Draw a character sprite and return the affected screen rect."""
         if not char.visible:
-            return
+            return None
 
         if char.being_eaten:
             size = int(CHARACTER_SIZE * char.eat_scale)
             if size < 1:
-                return
+                return None
             scaled = pygame.transform.scale(char.image, (size, size))
             rotated = pygame.transform.rotate(scaled, char.angle)
+        elif abs(char.angle) < MIN_ROTATION_ANGLE:
+            rotated = char.image
         else:
-            rotated = pygame.transform.rotate(char.image, char.angle)
+            rotated = _get_rotated(id(char.image), _quantize_angle(char.angle))
 
         rect = rotated.get_rect(center=(int(char.x), int(char.y)))
 
         if char.selected and not char.being_eaten:
-            highlight_rect = rect.inflate(10, 10)
-            pygame.draw.rect(self.screen, COLOR_SELECTED, highlight_rect, 4, border_radius=8)
+            highlight_rect = pygame.draw.rect(self.screen, COLOR_SELECTED, rect.inflate(10, 10),
+                                              4, border_radius=8)
+            self.screen.blit(rotated, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+            return rect.union(highlight_rect)
 
-        self.screen.blit(rotated, rect)
+        return self.screen.blit(rotated, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
     def draw_boat(self, boat):
-        """Draw the boat sprite with rotation."""
-        rotated = pygame.transform.rotate(boat.image, boat.angle)
+        """Draw the boat sprite and return the affected screen rect."""
+        if abs(boat.angle) < MIN_ROTATION_ANGLE:
+            rotated = boat.image
+        else:
+            rotated = _get_rotated(id(boat.image), _quantize_angle(boat.angle))
         rect = rotated.get_rect(center=(int(boat.x), int(boat.y)))
-        self.screen.blit(rotated, rect)
+        return self.screen.blit(rotated, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
     def draw_text_with_bg(self, text, font, pos, color=COLOR_BLACK):
-        """Draw text with a semi-transparent background."""
-        text_surf = font.render(text, True, color)
+        """Draw text with a semi-transparent background and return its rect."""
+        text_surf = _render(id(font), text, color)
         text_rect = text_surf.get_rect(topleft=pos)
 
         bg_rect = text_rect.inflate(10, 6)
-        bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surf.fill((255, 255, 255, 180))
-        self.screen.blit(bg_surf, bg_rect.topleft)
+        self.screen.blit(self._bg_tile, bg_rect.topleft, pygame.Rect((0, 0), bg_rect.size))
         self.screen.blit(text_surf, text_rect)
+        return bg_rect
 
     def draw_ui(self, state, move_count, boat_is_moving, passengers_count):
-        """Draw the game UI elements."""
-        self.draw_text_with_bg(f"Moves: {move_count}", self.font_medium, (10, 10))
+        """Draw the game UI elements and return the affected rects."""
+        rects = [self.draw_text_with_bg(f"Moves: {move_count}", self.font_medium, (10, 10))]
 
         state_str = (f"Left: {state.missionaries_left}M "
                      f"{state.cannibals_left}C | "
                      f"Right: {state.missionaries_right()}M "
                      f"{state.cannibals_right()}C")
-        self.draw_text_with_bg(state_str, self.font_small, (10, 50))
+        rects.append(self.draw_text_with_bg(state_str, self.font_small, (10, 50)))
 
         if not boat_is_moving:
             if passengers_count == 0:
                 hint = "Click characters to board the boat"
             else:
                 hint = "Press SPACE or click boat to cross"
-            hint_surf = self.font_small.render(hint, True, COLOR_BLACK)
+            hint_surf = _render(id(self.font_small), hint, COLOR_BLACK)
             hint_rect = hint_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
 
             bg_rect = hint_rect.inflate(20, 10)
-            bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            bg_surf.fill((255, 255, 255, 180))
-            self.screen.blit(bg_surf, bg_rect.topleft)
+            self.screen.blit(self._bg_tile, bg_rect.topleft, pygame.Rect((0, 0), bg_rect.size))
             self.screen.blit(hint_surf, hint_rect)
+            rects.append(bg_rect)
 
-        self.draw_text_with_bg("R: Restart | ESC: Quit", self.font_small,
-                               (SCREEN_WIDTH - 190, 10))
+        rects.append(self.draw_text_with_bg("R: Restart | ESC: Quit", self.font_small,
+                                            (SCREEN_WIDTH - 190, 10)))
+        return rects
 
-    def draw_welcome_screen(self):
-        """Draw the welcome screen with rules."""
-        self.screen.blit(self.background_img, (0, 0))
+    def build_welcome_static(self):
+        """Render the unchanging part of the welcome screen onto one surface."""
+        surface = self.background_img.copy()
 
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((255, 255, 255, 150))
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
 
         title = self.font_large.render("Missionaries and Cannibals", True, COLOR_BLACK)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 60))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
         m_rect = self.missionary_img.get_rect(center=(350, 140))
         c_rect = self.cannibal_img.get_rect(center=(650, 140))
-        self.screen.blit(self.missionary_img, m_rect)
-        self.screen.blit(self.cannibal_img, c_rect)
+        surface.blit(self.missionary_img, m_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+        surface.blit(self.cannibal_img, c_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
         rules = [
             "GOAL: Get all 3 missionaries and 3 cannibals across the river.",
@@ -122,22 +181,26 @@ class GameView:
         for line in rules:
             text = self.font_small.render(line, True, COLOR_BLACK)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
             y += 28
 
-        alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.005))
-        start_text = self.font_medium.render("Press SPACE to Start", True, COLOR_GREEN)
-        start_surf = start_text.copy()
-        start_surf.set_alpha(alpha)
-        start_rect = start_surf.get_rect(center=(SCREEN_WIDTH // 2, 480))
-        self.screen.blit(start_surf, start_rect)
+        return surface
+
+    def draw_welcome_screen(self):
+        """Draw the welcome screen with rules."""
+        self.screen.blit(self._welcome_static, (0, 0))
+
+        alpha = int(128 + 127 * fast_sin(pygame.time.get_ticks() * 0.005))
+        self._start_surf.set_alpha(alpha)
+        start_rect = self._start_surf.get_rect(center=(SCREEN_WIDTH // 2, 480))
+        self.screen.blit(self._start_surf, start_rect)
 
     def draw_end_screen(self, won, move_count):
-        """Draw the win or lose end screen."""
+        """Draw the win or lose end screen and return its rect."""
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.fill(COLOR_GREEN if won else COLOR_RED)
         overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        overlay_rect = self.screen.blit(overlay, (0, 0))
 
         if won:
             title = "CONGRATULATIONS!"
@@ -146,59 +209,80 @@ class GameView:
             title = "GAME OVER"
             message = "The missionaries were eaten!"
 
-        title_text = self.font_large.render(title, True, COLOR_WHITE)
+        title_text = _render(id(self.font_large), title, COLOR_WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 180))
         self.screen.blit(title_text, title_rect)
 
-        msg_text = self.font_medium.render(message, True, COLOR_WHITE)
+        msg_text = _render(id(self.font_medium), message, COLOR_WHITE)
         msg_rect = msg_text.get_rect(center=(SCREEN_WIDTH // 2, 250))
         self.screen.blit(msg_text, msg_rect)
 
-        restart_text = self.font_medium.render("Press R to Play Again", True, COLOR_WHITE)
+        restart_text = _render(id(self.font_medium), "Press R to Play Again", COLOR_WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, 340))
         self.screen.blit(restart_text, restart_rect)
 
-        quit_text = self.font_medium.render("Press ESC to Quit", True, COLOR_WHITE)
+        quit_text = _render(id(self.font_medium), "Press ESC to Quit", COLOR_WHITE)
         quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, 390))
         self.screen.blit(quit_text, quit_rect)
+        return overlay_rect
 
     def draw_eating_text(self, eating_timer):
-        """Draw the eating animation text."""
-        chomp_text = self.font_large.render("CHOMP CHOMP!", True, COLOR_RED)
-        chomp_rect = chomp_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        scale = 1.0 + 0.1 * math.sin(eating_timer * 10)
-        scaled = pygame.transform.scale(
-            chomp_text,
-            (int(chomp_rect.width * scale), int(chomp_rect.height * scale))
-        )
+        """Draw the eating animation text and return its rect."""
+        width, height = self._chomp_size
+        scale = 1.0 + 0.1 * fast_sin(eating_timer * 10)
+        scaled = pygame.transform.scale(self._chomp_surf, (int(width * scale), int(height * scale)))
         scaled_rect = scaled.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(scaled, scaled_rect)
+        return self.screen.blit(scaled, scaled_rect)
+
+    def invalidate(self):
+        """Force the next frame to repaint and present the whole screen."""
+        self._prev_dirty = [self.screen.get_rect()]
+
+    def present(self):
+        """Push the dirty regions of this and the previous frame to the display."""
+        rects = _merge_rects(self._dirty_rects + self._prev_dirty)
+        area = sum(r.width * r.height for r in rects)
+
+        if (len(rects) > MAX_DIRTY_RECTS or
+                area > SCREEN_WIDTH * SCREEN_HEIGHT * MAX_DIRTY_AREA_RATIO):
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+        self._prev_dirty, self._dirty_rects = self._dirty_rects, self._prev_dirty
 
     def draw(self, game_model):
         """Draw the current game state."""
+        self._dirty_rects = []
+
         if game_model.current_screen == GameScreen.WELCOME:
             self.draw_welcome_screen()
+            self._dirty_rects.append(self.screen.get_rect())
         else:
-            self.screen.blit(self.background_img, (0, 0))
+            for rect in self._prev_dirty:
+                self.screen.blit(self.background_img, rect, rect)
 
-            self.draw_boat(game_model.boat)
+            rects = [self.draw_boat(game_model.boat)]
 
             for char in game_model.get_all_characters():
                 if not char.in_boat:
-                    self.draw_character(char)
+                    rects.append(self.draw_character(char))
 
             for char in game_model.boat.passengers:
-                self.draw_character(char)
+                rects.append(self.draw_character(char))
 
             if game_model.current_screen == GameScreen.EATING:
-                self.draw_eating_text(game_model.eating_timer)
+                rects.append(self.draw_eating_text(game_model.eating_timer))
 
-            self.draw_ui(game_model.state, game_model.move_count,
-                         game_model.boat.is_moving, len(game_model.boat.passengers))
+            rects.extend(self.draw_ui(game_model.state, game_model.move_count,
+                                      game_model.boat.is_moving,
+                                      len(game_model.boat.passengers)))
 
             if game_model.current_screen == GameScreen.WON:
-                self.draw_end_screen(True, game_model.move_count)
+                rects.append(self.draw_end_screen(True, game_model.move_count))
             elif game_model.current_screen == GameScreen.LOST:
-                self.draw_end_screen(False, game_model.move_count)
+                rects.append(self.draw_end_screen(False, game_model.move_count))
+
+            self._dirty_rects = [rect for rect in rects if rect is not None]
 
-        pygame.display.flip()
+        self.present()